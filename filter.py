@@ -1,29 +1,124 @@
+import csv
 import json
-import pandas as pd
 
-def filter_jobs(js):
-    # 读取全部jsonl行，组装为DataFrame
-    data_list = []
-    with open(js, 'r', encoding='utf-8') as f:
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.json as paj
+except ImportError:
+    pa = None
+    paj = None
+
+
+# 导出CSV时去掉的列
+DROP_COLUMNS = frozenset({"pageno", "pageRequestId", "sourceUrl", "jobId", "companyId", "capturedAt", "lat", "lon", "jobTermCode", "jobTags_json", "sesameLabels_json", "property_json", "funcType1", "isAd"})
+
+
+def _loads(line):
+    # 优先用orjson（直接解析bytes，比标准库json快数倍），其次ujson
+    if orjson is not None:
+        return orjson.loads(line)
+    if ujson is not None:
+        return ujson.loads(line)
+    return json.loads(line)
+
+
+def _first_record(js):
+    # 返回第一条非空记录，空文件返回{}
+    with open(js, 'rb') as f:
         for line in f:
             if line.strip():
-                data = json.loads(line)
-                data_list.append(data)
+                return _loads(line)
+    return {}
+
 
+def _arrow_type(v):
+    # 按首条记录的值确定列类型；字符串/空值一律按字符串读取，避免"2024-05-01"之类被推断成时间戳
+    if isinstance(v, bool):
+        return pa.bool_()
+    if isinstance(v, int):
+        return pa.int64()
+    if isinstance(v, float):
+        return pa.float64()
+    return pa.string()
+
+
+def _read_jobs_table(js):
+    # 用pyarrow把jsonl直接解析为列式表，列顺序与首条记录一致
+    first = _first_record(js)
+    columns = [c for c in first if c not in DROP_COLUMNS]
+    schema = pa.schema([(c, _arrow_type(first[c])) for c in columns])
+    # 只解析保留的列：被丢弃的列（lat/lon/isAd等数值与""混杂的字段）直接跳过，不参与类型推断
+    table = paj.read_json(js, read_options=paj.ReadOptions(block_size=8 << 20),
+                          parse_options=paj.ParseOptions(explicit_schema=schema, unexpected_field_behavior="ignore"))
+    return table.select(columns)
+
+
+def _read_jobs_rows(js):
+    # 回退路径：逐行解析为dict
+    with open(js, 'rb') as f:
+        data_list = [_loads(line) for line in f if line.strip()]
     df = pd.DataFrame(data_list)
+    return df.drop(columns=[c for c in DROP_COLUMNS if c in df.columns])
+
+
+def load_jobs(js):
+    # 读取全部jsonl行为DataFrame（已去掉DROP_COLUMNS），便于在notebook中交互查看
+    if pd is None:
+        # 只有load_jobs依赖pandas，filter_jobs不需要
+        raise ImportError("load_jobs requires pandas (pip install pandas)")
+    df = None
+    if paj is not None:
+        try:
+            df = _read_jobs_table(js).to_pandas(types_mapper=pd.ArrowDtype)
+        except pa.ArrowInvalid as e:
+            # 例如某个保留列在不同行中数字与字符串混杂
+            print(f"[filter] pyarrow read failed, falling back to row parsing: {e}")
+    if df is None:
+        df = _read_jobs_rows(js)
     print(f"Loaded {len(df)} rows")
 
-    # 显示头部数据（不显示pageno列），并可在notebook中交互显示
+    # 显示头部数据（不显示pageno列）
     pd.set_option('display.expand_frame_repr', False)
     pd.set_option('display.width', 200)
 
-    df = df.drop(columns=["pageno", "pageRequestId", "sourceUrl","sourceUrl", "jobId", "companyId", "capturedAt","lat", "lon", "jobTermCode", "jobTags_json", "sesameLabels_json","property_json","funcType1","isAd"])
+    return df
+
 
-    # to html
-    df.to_csv("yingjiesheng_jobs_filtered.csv", index=False, encoding="utf-8-sig")
+def filter_jobs(js, out="yingjiesheng_jobs_filtered.csv"):
+    # 去掉DROP_COLUMNS后导出CSV（utf-8-sig），返回写出的行数；逐行流式转换，内存占用与文件大小无关
+    n = 0
+    with open(js, 'rb', buffering=1 << 20) as f_in, \
+            open(out, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f_out:
+        writer = None
+        for line in f_in:
+            if not line.strip():
+                continue
+            row = _loads(line)
+            if writer is None:
+                # 表头取自首条记录（所有行的字段都来自_normalize_job，一致）
+                writer = csv.DictWriter(f_out, fieldnames=[k for k in row if k not in DROP_COLUMNS], extrasaction='ignore', lineterminator='\n')
+                writer.writeheader()
+            writer.writerow(row)
+            n += 1
 
-    return df
+    print(f"Wrote {n} rows to {out}")
+    return n
 
 if __name__ == "__main__":
     js = '/Users/zli142/Desktop/workbench_local/yingjiesheng_scraper/yingjiesheng_jobs_人力资源_山东.jsonl'
-    df = filter_jobs(js)
\ No newline at end of file
+    filter_jobs(js)
@@ -1,32 +1,88 @@
 import asyncio
+import functools
+import hashlib
 import json
+import math
 import random
 import time
 import argparse
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass, is_dataclass
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs, quote
+from urllib.parse import quote, unquote_plus
 
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import pickle
 import re
+import struct
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# English-only comments: fastest available JSON decoder (orjson > ujson > stdlib); all accept str or bytes
+if orjson is not None:
+    _json_loads = orjson.loads
+elif ujson is not None:
+    _json_loads = ujson.loads
+else:
+    _json_loads = json.loads
 
 
 # ======================
 # Config (argparse)
 # ======================
 
+_RE_UNSAFE = re.compile(r"[\\/:*?\"<>|]+")
+_RE_WS = re.compile(r"\s+")
+# English-only comments: substring that marks a job search API response
+SEARCH_API_NEEDLE = "youngapi.yingjiesheng.com/open/noauth/job/search"
+# English-only comments: the only query params on_response needs from a search API URL
+_RE_SEARCH_QS = re.compile(r"[?&](keyword|pageno|jobarea)=([^&#]*)")
+_RE_PAGENO_PARAM = re.compile(r"([?&]pageno=)\d+")
+
+
+def _search_params(url: str) -> tuple[str, str, str] | None:
+    # English-only comments: (keyword, pageno, jobarea) of a search API URL, None for any other URL;
+    # the needle check is a C-level substring search, the fast path for the many non-API responses
+    if SEARCH_API_NEEDLE not in url:
+        return None
+    qs = {}
+    setdefault = qs.setdefault
+    # English-only comments: first occurrence wins, like parse_qs(...)[key][0]
+    for k, v in _RE_SEARCH_QS.findall(url):
+        setdefault(k, v)
+    return unquote_plus(qs.get("keyword", "")), qs.get("pageno", ""), unquote_plus(qs.get("jobarea", ""))
+
+
 def _sanitize_filename(s: str) -> str:
     # English-only comments: make output filenames filesystem-safe
     s = (s or "").strip()
-    s = re.sub(r"[\\/:*?\"<>|]+", "_", s)
-    s = re.sub(r"\s+", "_", s)
+    s = _RE_UNSAFE.sub("_", s)
+    s = _RE_WS.sub("_", s)
     return s[:120] if len(s) > 120 else s
 
 
 def get_args():
-    parser = argparse.ArgumentParser(description="Yingjiesheng scraper (UI-only, robust pagination)")
+    parser = argparse.ArgumentParser(
+        description="Yingjiesheng scraper (UI pagination by default; --api-workers opts into direct, "
+                    "undelayed search API requests)"
+    )
     parser.add_argument("--keyword", type=str, default="人力资源", help="Search keyword")
     parser.add_argument("--area-name", type=str, default="山东", help="Area name: 山东/山东省/青岛/全国")
     parser.add_argument("--state-path", type=str, default="yjs_state.json", help="Playwright storage_state path")
@@ -38,7 +94,15 @@ def get_args():
     parser.add_argument("--min-delay-s", type=float, default=8.0, help="Min delay between actions (sec)")
     parser.add_argument("--max-delay-s", type=float, default=16.0, help="Max delay between actions (sec)")
     parser.add_argument("--click-timeout-ms", type=int, default=3000, help="Click timeout (ms)")
-    parser.add_argument("--no-progress-limit", type=int, default=6, help="Stop after N no-progress actions")
+    parser.add_argument("--no-progress-limit", type=int, default=5, help="Stop after N no-progress actions")
+    parser.add_argument(
+        "--api-workers",
+        type=int,
+        default=0,
+        help="If >0, fetch pages 2..N straight from the search API with this many concurrent requests "
+             "and no delay between them, after page 1 loads (UI pagination only fills gaps); much higher "
+             "load on the site and higher ban risk. 0 = UI pagination only",
+    )
 
     # Your confirmed Next button info
     parser.add_argument(
@@ -84,12 +148,15 @@ KEYWORD = ARGS.keyword
 STATE_PATH = ARGS.state_path
 OUT_JOBS_JSONL = ARGS.out_jobs_jsonl
 OUT_PAGES_JSONL = ARGS.out_pages_jsonl
+# English-only comments: append-only job-id digests for resuming de-dup across runs (tied to the jobs JSONL)
+SEEN_JOBS_IDX = f"{OUT_JOBS_JSONL}.seen.idx"
 
 MAX_PAGE_ACTIONS = ARGS.max_page_actions
 MIN_DELAY_S = ARGS.min_delay_s
 MAX_DELAY_S = ARGS.max_delay_s
 CLICK_TIMEOUT_MS = ARGS.click_timeout_ms
 NO_PROGRESS_LIMIT = ARGS.no_progress_limit
+API_WORKERS = max(0, ARGS.api_workers)
 
 NEXT_BTN_SELECTOR = ARGS.next_btn_selector
 NEXT_BTN_XPATH = ARGS.next_btn_xpath
@@ -99,6 +166,11 @@ CITY_DICT_PATH = Path(ARGS.city_dict_path)
 AREA_NAME = ARGS.area_name
 
 
+# English-only comments: one shared HTTP session (connection pool + retries) for all plain HTTP fetches
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=8, max_retries=3))
+
+
 # ======================
 # City dict: area-name -> jobarea code
 # ======================
@@ -109,26 +181,36 @@ def ensure_city_dict(path: Path, allow_download: bool = True) -> None:
         return
     if not allow_download:
         raise FileNotFoundError(f"City dict not found: {path}")
-    r = requests.get(CITY_DICT_URL, timeout=30)
+    r = _SESSION.get(CITY_DICT_URL, timeout=30)
     r.raise_for_status()
-    path.write_text(r.text, encoding="utf-8")
+    # English-only comments: store the raw bytes; r.text would guess a charset, decode, and re-encode
+    path.write_bytes(r.content)
 
 
 def load_city_dict(path: Path) -> dict:
     # English-only comments: load dd_city.json
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _json_loads(path.read_bytes())
+
+
+# English-only comments: container types the city-dict walker descends into (plus simdjson's lazy proxies)
+_JSON_OBJECT_TYPES = (dict, simdjson.Object) if simdjson is not None else (dict,)
+_JSON_ARRAY_TYPES = (list, simdjson.Array) if simdjson is not None else (list,)
 
 
 def collect_code_name_pairs(node, out: list[tuple[str, str]]) -> None:
-    # English-only comments: recursively collect (code, value) pairs
-    if isinstance(node, dict):
-        if "code" in node and "value" in node:
-            out.append((str(node["code"]), str(node["value"])))
-        for v in node.values():
-            collect_code_name_pairs(v, out)
-    elif isinstance(node, list):
-        for x in node:
-            collect_code_name_pairs(x, out)
+    # English-only comments: collect (code, value) pairs with an explicit stack (no recursion frames)
+    stack = [node]
+    pop = stack.pop
+    push_all = stack.extend
+    append = out.append
+    while stack:
+        n = pop()
+        if isinstance(n, _JSON_OBJECT_TYPES):
+            if "code" in n and "value" in n:
+                append((str(n["code"]), str(n["value"])))
+            push_all(n.values())
+        elif isinstance(n, _JSON_ARRAY_TYPES):
+            push_all(n)
 
 
 def build_name_to_codes(city_dict: dict) -> dict[str, list[str]]:
@@ -141,6 +223,54 @@ def build_name_to_codes(city_dict: dict) -> dict[str, list[str]]:
     return m
 
 
+def load_name_to_codes(path: Path) -> dict[str, list[str]]:
+    """
+    Load the area name -> codes mapping, using a pickled sidecar cache when it is fresh.
+
+    The sidecar (`dd_city.ntc.pkl` next to `dd_city.json`) starts with a 16-byte stamp
+    (mtime_ns, size) of the JSON file, followed by the pickled mapping. A stale or
+    unreadable sidecar is rebuilt from the JSON and replaced atomically.
+
+    Parameters
+    ----------
+    path:
+        Local dd_city.json path.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Same mapping as `build_name_to_codes(load_city_dict(path))`.
+    """
+    st = path.stat()
+    stamp = struct.pack("<qq", st.st_mtime_ns, st.st_size)
+    cache_path = path.with_suffix(".ntc.pkl")
+
+    try:
+        with open(cache_path, "rb") as f:
+            if f.read(len(stamp)) == stamp:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    if simdjson is not None:
+        # English-only comments: walk simdjson's lazy proxies; only the code/value leaves become Python objects
+        parser = simdjson.Parser()
+        name_to_codes = build_name_to_codes(parser.load(str(path)))
+    else:
+        name_to_codes = build_name_to_codes(load_city_dict(path))
+    # English-only comments: write to a temp file then os.replace so readers never see a partial cache
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(stamp)
+            pickle.dump(name_to_codes, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return name_to_codes
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_area_name(name: str) -> str:
     # English-only comments: normalize common user inputs
     name = (name or "").strip()
@@ -205,24 +335,65 @@ def resolve_jobarea_code(area_name: str, name_to_codes: dict[str, list[str]]) ->
 
 
 ensure_city_dict(CITY_DICT_PATH, allow_download=True)
-_city_dict = load_city_dict(CITY_DICT_PATH)
-_name_to_codes = build_name_to_codes(_city_dict)
-JOBAREA = resolve_jobarea_code(AREA_NAME, _name_to_codes)
+_name_to_codes = load_name_to_codes(CITY_DICT_PATH)
+
+
+@functools.lru_cache(maxsize=512)
+def resolve_area(area_name: str) -> str:
+    # English-only comments: memoized resolve_jobarea_code against the mapping loaded above (lookup errors are not cached)
+    return resolve_jobarea_code(area_name, _name_to_codes)
+
+
+JOBAREA = resolve_area(AREA_NAME)
 print(f"[area] AREA_NAME={AREA_NAME} -> JOBAREA={JOBAREA!r}")
 
+# English-only comments: search page URL depends only on CLI args; built once, reused by every crawl() attempt
+KW_ENC = quote(KEYWORD, safe="")
+if JOBAREA != "":
+    SEARCH_URL = f"https://q.yingjiesheng.com/jobs/search/?jobarea={JOBAREA}&keyword={KW_ENC}"
+else:
+    SEARCH_URL = f"https://q.yingjiesheng.com/jobs/search?keyword={KW_ENC}"
+
 
 # ======================
 # Utilities
 # ======================
 
+_NOW_ISO_CACHE = ["", -1]
+
+
 def _now_iso():
-    # English-only comments: local timestamp for traceability
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+    # English-only comments: local timestamp for traceability, formatted at most once per wall-clock second
+    t = int(time.time())
+    if t != _NOW_ISO_CACHE[1]:
+        _NOW_ISO_CACHE[0] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(t))
+        _NOW_ISO_CACHE[1] = t
+    return _NOW_ISO_CACHE[0]
+
+
+def _json_default(obj):
+    # English-only comments: stdlib json fallback for dataclass records (orjson serializes them natively)
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def _json_dumps(obj):
-    # English-only comments: compact JSON for JSONL
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    # English-only comments: compact JSON for JSONL (orjson/ujson output is already compact and non-ASCII-preserving)
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    if ujson is not None:
+        if is_dataclass(obj):
+            obj = asdict(obj)
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+
+
+def _json_dumps_b(obj) -> bytes:
+    # English-only comments: same as _json_dumps but UTF-8 bytes, for files opened in binary mode
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_dumps(obj).encode("utf-8")
 
 
 def _safe_json_loads(s):
@@ -230,89 +401,351 @@ def _safe_json_loads(s):
     if not isinstance(s, str) or not s:
         return None
     try:
-        return json.loads(s)
+        return _json_loads(s)
     except Exception:
         return None
 
 
 def _list_to_str(v, sep="|"):
-    # English-only comments: normalize list to a CSV-friendly string
-    if isinstance(v, list):
+    # English-only comments: normalize list to a CSV-friendly string (exact type check: JSON only yields plain lists)
+    if type(v) is list:
         return sep.join([str(x) for x in v if x is not None])
-    if v is None:
-        return ""
-    return str(v)
+    return "" if v is None else str(v)
 
 
-def _normalize_job(item: dict, keyword: str, pageno: str, page_request_id: str, source_url: str) -> dict:
-    # English-only comments: flatten fields for easy CSV conversion
-    prop = _safe_json_loads(item.get("property")) or {}
+@dataclass(slots=True)
+class JobRec:
+    """
+    The per-job part of a jobs JSONL row, in output column order.
+
+    Page-level columns (capturedAt, keyword, pageno, pageRequestId, sourceUrl and the
+    trailing jobareaCode) are identical for every job on a page; they are serialized once
+    per page by _job_line_affixes() and wrapped around the serialized record.
+
+    Pass-through fields keep whatever type the API sent (normally str). Serialize with
+    _json_dumps/_json_dumps_b; use dataclasses.astuple/asdict when a row/dict is needed.
+    """
+    jobId: str
+    companyId: str
+    jobTitle: str
+    companyName: str
+    jobArea: str
+    salary: str
+    jobTerm: str
+    jobTermCode: str
+    workYear: str
+    degree: str
+    coType: str
+    coSize: str
+    industry: str
+    issueDate: str
+    lastUpdate: str
+    jobDetailUrl: str
+    jobTags: str
+    jobTags_json: str
+    sesameLabels: str
+    sesameLabels_json: str
+    lat: str
+    lon: str
+    funcType1: str
+    funcType1Str: str
+    isAd: str
+    hrName: str
+    hrPosition: str
+    hrActiveStatus: str
+    property_json: str
+
+
+def _normalize_job(item: dict, _loads=_safe_json_loads, _dumps=_json_dumps, _join=_list_to_str,
+                   _rec=JobRec) -> JobRec:
+    # English-only comments: flatten fields for easy CSV conversion; helpers are default args (local loads per job)
+    raw_prop = item.get("property")
+    prop = _loads(raw_prop) or {}
     labels = item.get("sesameLabelList") or []
     job_tags = item.get("jobTags") or []
 
-    job_id = str(item.get("jobid") or item.get("jobId") or prop.get("jobId") or "").strip()
-    company_id = str(item.get("coid") or item.get("companyId") or prop.get("companyId") or "").strip()
+    # English-only comments: bind the bound methods once; this function runs for every job record
+    get = item.get
+    prop_get = prop.get
 
-    return {
-        "capturedAt": _now_iso(),
+    job_id = str(get("jobid") or get("jobId") or prop_get("jobId") or "").strip()
+    company_id = str(get("coid") or get("companyId") or prop_get("companyId") or "").strip()
+
+    return _rec(
+        jobId=job_id,
+        companyId=company_id,
+
+        jobTitle=get("jobname") or get("jobTitle") or prop_get("jobTitle") or "",
+        companyName=get("coname") or get("companyName") or prop_get("companyName") or "",
+
+        jobArea=get("jobarea") or "",
+        salary=get("providesalary") or get("monthSalary") or prop_get("monthSalary") or "",
+        jobTerm=get("jobterm") or "",
+        jobTermCode=get("jobtermCode") or "",
+        workYear=get("workyear") or "",
+        degree=get("degree") or "",
+        coType=get("cotype") or "",
+        coSize=get("cosize") or "",
+        industry=get("indtype") or "",
+
+        issueDate=get("issuedate") or "",
+        lastUpdate=get("lastupdate") or "",
+
+        jobDetailUrl=get("jumpUrlHttp") or "",
+
+        jobTags=_join(job_tags, sep="|"),
+        jobTags_json=_dumps(job_tags) if isinstance(job_tags, list) else "[]",
+        sesameLabels=_join([x.get("labelName", "") for x in labels if isinstance(x, dict)], sep="|"),
+        sesameLabels_json=_dumps(labels) if isinstance(labels, list) else "[]",
+
+        lat=get("lat") or "",
+        lon=get("lon") or "",
+
+        funcType1=get("funcType1") or "",
+        funcType1Str=get("funcType1Str") or "",
+        isAd=get("isad") or get("isAd") or "",
+
+        hrName=get("hrName") or "",
+        hrPosition=get("hrPosition") or "",
+        hrActiveStatus=get("hrActiveStatus") or "",
+
+        # English-only comments: "property" already arrives as a JSON string; keep it instead of re-serializing
+        property_json=raw_prop if prop else "{}",
+    )
+
+
+def _job_line_affixes(captured_at: str, keyword: str, pageno: str, page_request_id: str,
+                      source_url: str, jobarea_code: str) -> tuple[bytes, bytes]:
+    """
+    Pre-serialize the page-level columns of a jobs JSONL row.
+
+    A full row is `prefix + _json_dumps_b(rec)[1:-1] + suffix` for a JobRec `rec`, which
+    yields the same bytes as serializing one flat dict with the page-level keys first and
+    jobareaCode last, without re-encoding those keys for every job.
+
+    Returns
+    -------
+    tuple[bytes, bytes]
+        (prefix, suffix): prefix is `{"capturedAt":...,"sourceUrl":...,` and suffix is
+        `,"jobareaCode":...}` plus the trailing newline.
+    """
+    head = _json_dumps_b({
+        "capturedAt": captured_at,
         "keyword": keyword,
         "pageno": str(pageno),
         "pageRequestId": page_request_id or "",
         "sourceUrl": source_url,
+    })
+    tail = _json_dumps_b({"jobareaCode": jobarea_code})
+    return head[:-1] + b",", b"," + tail[1:] + b"\n"
 
-        "jobId": job_id,
-        "companyId": company_id,
 
-        "jobTitle": item.get("jobname") or item.get("jobTitle") or prop.get("jobTitle") or "",
-        "companyName": item.get("coname") or item.get("companyName") or prop.get("companyName") or "",
+async def sleep_with_progress(seconds: float, prefix: str = ""):
+    # English-only comments: one timer-based sleep; countdown redraws are scheduled callbacks, not loop wakeups
+    loop = asyncio.get_running_loop()
 
-        "jobArea": item.get("jobarea") or "",
-        "salary": item.get("providesalary") or item.get("monthSalary") or prop.get("monthSalary") or "",
-        "jobTerm": item.get("jobterm") or "",
-        "jobTermCode": item.get("jobtermCode") or "",
-        "workYear": item.get("workyear") or "",
-        "degree": item.get("degree") or "",
-        "coType": item.get("cotype") or "",
-        "coSize": item.get("cosize") or "",
-        "industry": item.get("indtype") or "",
+    def redraw(left: int) -> None:
+        print(f"\r{prefix} sleeping {seconds:.1f}s (remaining {left:02d}s)", end="", flush=True)
 
-        "issueDate": item.get("issuedate") or "",
-        "lastUpdate": item.get("lastupdate") or "",
+    total = max(0, int(round(seconds)))
+    handles = [loop.call_later(k, redraw, total - k) for k in range(1, total)]
+    redraw(total)
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        for h in handles:
+            h.cancel()
+    redraw(0)
+    print()
 
-        "jobDetailUrl": item.get("jumpUrlHttp") or "",
 
-        "jobTags": _list_to_str(job_tags, sep="|"),
-        "jobTags_json": _json_dumps(job_tags) if isinstance(job_tags, list) else "[]",
-        "sesameLabels": _list_to_str([x.get("labelName", "") for x in labels if isinstance(x, dict)], sep="|"),
-        "sesameLabels_json": _json_dumps(labels) if isinstance(labels, list) else "[]",
+class BloomFilter:
+    """
+    Fixed-size Bloom filter for string keys (used for job-id de-duplication).
 
-        "lat": item.get("lat") or "",
-        "lon": item.get("lon") or "",
+    Memory is constant (sized from `capacity` and `error_rate`) no matter how many ids a
+    long crawl sees. Membership may report a false positive with probability about
+    `error_rate` while at most `capacity` keys have been added; for de-duplication that
+    only means an occasional job is skipped. There are no false negatives and no `len()`;
+    callers keep their own count.
 
-        "funcType1": item.get("funcType1") or "",
-        "funcType1Str": item.get("funcType1Str") or "",
-        "isAd": item.get("isad") or item.get("isAd") or "",
+    Parameters
+    ----------
+    capacity:
+        Expected number of distinct keys.
+    error_rate:
+        Target false-positive probability at `capacity` keys.
+    """
 
-        "hrName": item.get("hrName") or "",
-        "hrPosition": item.get("hrPosition") or "",
-        "hrActiveStatus": item.get("hrActiveStatus") or "",
+    __slots__ = ("n_bits", "n_hashes", "bits")
 
-        "property_json": _json_dumps(prop) if isinstance(prop, dict) else "{}",
-    }
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-9):
+        n_bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.n_bits = n_bits
+        self.n_hashes = max(1, int(round(n_bits / capacity * math.log(2))))
+        self.bits = bytearray((n_bits + 7) // 8)
 
+    DIGEST_SIZE = 16
 
-async def sleep_with_progress(seconds: float, prefix: str = ""):
-    # English-only comments: show countdown
-    start = time.time()
-    while True:
-        elapsed = time.time() - start
-        left = max(0, int(round(seconds - elapsed)))
-        msg = f"{prefix} sleeping {seconds:.1f}s (remaining {left:02d}s)"
-        print("\r" + msg, end="", flush=True)
-        if elapsed >= seconds:
-            break
-        await asyncio.sleep(1)
-    print()
+    @staticmethod
+    def key_digest(key: str) -> bytes:
+        # English-only comments: the 128-bit blake2b digest all probe positions derive from; persistable as-is
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=BloomFilter.DIGEST_SIZE).digest()
+
+    def _positions(self, d: bytes):
+        # English-only comments: double hashing (h1 + i*h2) from one 128-bit digest
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        n = self.n_bits
+        return [(h1 + i * h2) % n for i in range(self.n_hashes)]
+
+    def contains_digest(self, d: bytes) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(d))
+
+    def add_digest(self, d: bytes) -> None:
+        bits = self.bits
+        for p in self._positions(d):
+            bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return self.contains_digest(self.key_digest(key))
+
+    def add(self, key: str) -> None:
+        self.add_digest(self.key_digest(key))
+
+
+def load_seen_job_digests(bloom: BloomFilter, idx_path: str, jobs_path: str) -> int:
+    """
+    Seed a BloomFilter from the job-id digests persisted by earlier runs.
+
+    The index is only trusted while the jobs JSONL it describes still has data; if that file
+    is missing or empty the index is deleted so a fresh crawl does not skip every job. A
+    partial trailing record (crash mid-append) is truncated so later appends stay aligned.
+
+    Returns
+    -------
+    int
+        Number of digests loaded.
+    """
+    idx = Path(idx_path)
+    jobs = Path(jobs_path)
+    if not jobs.exists() or jobs.stat().st_size == 0:
+        idx.unlink(missing_ok=True)
+        return 0
+    try:
+        data = idx.read_bytes()
+    except FileNotFoundError:
+        return 0
+
+    size = BloomFilter.DIGEST_SIZE
+    n = len(data) // size
+    if len(data) != n * size:
+        os.truncate(idx, n * size)
+    add = bloom.add_digest
+    for i in range(0, n * size, size):
+        add(data[i:i + size])
+    return n
+
+
+def _write_and_flush(f, blob: bytes, flush: bool = True, f_idx=None, idx_blob: bytes = b"") -> None:
+    # English-only comments: runs in a worker thread (asyncio.to_thread), never on the event loop;
+    # index bytes are only written after the data they describe has been flushed
+    if blob:
+        f.write(blob)
+    if flush:
+        f.flush()
+        if idx_blob:
+            f_idx.write(idx_blob)
+            f_idx.flush()
+
+
+async def jsonl_writer_task(path: str, q: asyncio.Queue, flush_interval_s: float = 1.0,
+                            index_path: str | None = None) -> None:
+    """
+    Drain pre-serialized JSONL lines from a queue and append them to a file off the event loop.
+
+    The Playwright response handlers only enqueue bytes (`q.put_nowait(blob)`, one or more
+    whole lines, e.g. all rows of a page); this task batches whatever is queued (up to 256
+    items) and writes the batch in a worker thread.
+    Flushes are time-based: at most one per `flush_interval_s`, and pending data is flushed
+    once the queue has been idle that long, so pages arriving in a burst (e.g. concurrent API
+    fetches) share one flush and a crash loses at most about a second of rows. Put `None` on
+    the queue to stop; queued lines before it are still written and the file is flushed.
+
+    Parameters
+    ----------
+    path:
+        Output file, opened in binary append mode on the first batch and kept open (one
+        descriptor) for the task's lifetime; never created if nothing is written.
+    q:
+        asyncio.Queue of `bytes` blobs of whole lines (ending with b"\n"), terminated by `None`.
+        With `index_path`, items are `(blob, index_blob)` tuples instead.
+    flush_interval_s:
+        Maximum time written lines may sit in the user-space buffer.
+    index_path:
+        Optional sidecar file for the `index_blob` parts. They are appended only after the
+        matching `blob` has been flushed to `path`, so after a crash the index never lists
+        records the data file does not have.
+
+    Returns
+    -------
+    None
+    """
+    f = None
+    f_idx = None
+    pending_idx: list[bytes] = []
+    dirty = False
+    last_flush = time.monotonic()
+    try:
+        done = False
+        while not done:
+            if dirty:
+                try:
+                    wait_s = max(0.0, last_flush + flush_interval_s - time.monotonic())
+                    item = await asyncio.wait_for(q.get(), timeout=wait_s)
+                except asyncio.TimeoutError:
+                    idx_blob = b"".join(pending_idx)
+                    pending_idx.clear()
+                    await asyncio.to_thread(_write_and_flush, f, b"", True, f_idx, idx_blob)
+                    dirty = False
+                    last_flush = time.monotonic()
+                    continue
+            else:
+                item = await q.get()
+            if item is None:
+                break
+            batch = [item]
+            while not q.empty() and len(batch) < 256:
+                item = q.get_nowait()
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+            if index_path is not None:
+                pending_idx.extend(idx for _, idx in batch if idx)
+                batch = [blob for blob, _ in batch]
+                if f_idx is None and pending_idx:
+                    f_idx = open(index_path, "ab")
+            if f is None:
+                f = open(path, "ab", buffering=1 << 20)
+            flush = time.monotonic() - last_flush >= flush_interval_s
+            idx_blob = b""
+            if flush:
+                idx_blob = b"".join(pending_idx)
+                pending_idx.clear()
+            await asyncio.to_thread(_write_and_flush, f, b"".join(batch), flush, f_idx, idx_blob)
+            if flush:
+                last_flush = time.monotonic()
+            dirty = not flush
+    finally:
+        if f is not None:
+            f.close()
+            # English-only comments: data is on disk now (close flushed it); index whatever it covered
+            if pending_idx:
+                f_idx.write(b"".join(pending_idx))
+        if f_idx is not None:
+            f_idx.close()
 
 
 async def goto_with_retries(page, url: str, attempts: int = 3, timeout_ms: int = 90000):
@@ -393,12 +826,17 @@ ASYNC_CLOSE_OVERLAY_JS = """
 }
 """
 
+# English-only comments: installed once per context (context.add_init_script) so later calls only send a bare call
+CLOSE_OVERLAY_INIT_JS = f"window.__closeOverlay = {ASYNC_CLOSE_OVERLAY_JS.strip()};"
+
 
 async def force_defocus_and_hide_overlay(page):
     """
     Force-blur the currently focused element and hide known ElementUI popper overlays.
 
     This is used to reduce click interception from autocomplete/select dropdown poppers.
+    When CLOSE_OVERLAY_INIT_JS has been installed on the context, only the bare
+    `window.__closeOverlay()` call crosses CDP; otherwise the full script is sent.
 
     Parameters
     ----------
@@ -411,7 +849,11 @@ async def force_defocus_and_hide_overlay(page):
     """
     # English-only comments: deterministic close of autocomplete overlay
     try:
-        await page.evaluate(ASYNC_CLOSE_OVERLAY_JS)
+        installed = await page.evaluate(
+            "() => typeof window.__closeOverlay === 'function' && (window.__closeOverlay(), true)"
+        )
+        if not installed:
+            await page.evaluate(ASYNC_CLOSE_OVERLAY_JS)
     except Exception:
         pass
     try:
@@ -440,223 +882,112 @@ async def escape_and_defocus(page) -> None:
     await force_defocus_and_hide_overlay(page)
 
 
-async def center_locator_with_offset(page, locator, y_offset_px: int) -> None:
-    """
-    Scroll a locator into view (centered) and then scroll up by a fixed offset.
-
-    Rationale: the page may have fixed/sticky footers or floating widgets near the
-    bottom edge which can cover pagination controls. Centering and applying an
-    upward offset keeps the target away from that cover zone.
-
-    Parameters
-    ----------
-    page:
-        Playwright Page object.
-    locator:
-        Playwright Locator for the element to bring into view.
-    y_offset_px:
-        Positive integer pixels to scroll upward after centering (e.g., 160).
-
-    Returns
-    -------
-    None
-    """
-    await locator.evaluate(
-        "(el) => el.scrollIntoView({block: 'center', inline: 'center'})"
-    )
-    await page.wait_for_timeout(80)
-    await page.evaluate("(dy) => window.scrollBy(0, -dy)", int(y_offset_px))
-    await page.wait_for_timeout(80)
-
-
-async def _resolve_next_button_locator(page):
-    """
-    Resolve a reliable "Next page" button locator.
-
-    The page may contain multiple matches for the configured selector/XPath (e.g., hidden
-    templates, duplicated pagination controls). This resolver returns the first element
-    that is:
-    - visible
-    - has a non-empty bounding box (width/height > 2 px)
-
-    Parameters
-    ----------
-    page:
-        Playwright Page object.
-
-    Returns
-    -------
-    Locator | None
-        A Locator pointing to the best candidate Next button element, or None if no
-        suitable candidate is found.
-    """
-    candidates = []
-    css = page.locator(NEXT_BTN_SELECTOR)
-    if await css.count() > 0:
-        candidates.append(css)
-    xp = page.locator(f"xpath={NEXT_BTN_XPATH}")
-    if await xp.count() > 0:
-        candidates.append(xp)
-
-    for group in candidates:
-        n = await group.count()
-        # English-only comments: guard against unexpected huge match sets
-        n = min(n, 30)
-        for i in range(n):
-            el = group.nth(i)
-            if not await el.is_visible():
-                continue
-            box = await el.bounding_box()
-            if not box:
-                continue
-            if box.get("width", 0) <= 2 or box.get("height", 0) <= 2:
-                continue
-            return el
-
-    return None
+# ======================
+# Click Next (XPath + mouse down/up)
+# ======================
 
+CLICK_NEXT_FUSED_JS = """
+async (args) => {
+  // One round-trip: resolve Next, check disabled, scroll into place, hit-test, disable interceptor, re-test
+  const { selector, xpath, yOffset } = args;
+
+  // Let scroll-driven listeners (sticky headers/footers, lazy layout) run before hit-testing
+  const settle = () => new Promise((resolve) => setTimeout(resolve, 80));
+  const center = () => {
+    el.scrollIntoView({ block: 'center', inline: 'center', behavior: 'instant' });
+    window.scrollBy({ top: -yOffset, left: 0, behavior: 'instant' });
+  };
+
+  const summarize = (node) => {
+    const tag = node && node.tagName ? node.tagName.toLowerCase() : '';
+    const id = node && node.id ? node.id : '';
+    const cls = node && node.className ? String(node.className).trim().replace(/\\s+/g, '.') : '';
+    return tag ? `${tag}${id ? '#' + id : ''}${cls ? '.' + cls : ''}` : '';
+  };
+  const viewport = { width: window.innerWidth, height: window.innerHeight };
+
+  // Candidates: CSS matches first, then XPath matches (each capped at 30)
+  const candidates = [];
+  try {
+    const css = document.querySelectorAll(selector);
+    for (let i = 0; i < css.length && i < 30; i++) candidates.push(css[i]);
+  } catch (e) {}
+  try {
+    const snap = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snap.snapshotLength && i < 30; i++) candidates.push(snap.snapshotItem(i));
+  } catch (e) {}
+
+  // First visible candidate with a non-empty box (width/height > 2 px)
+  let el = null;
+  for (const c of candidates) {
+    const r = c.getBoundingClientRect();
+    if (r.width <= 2 || r.height <= 2) continue;
+    const style = window.getComputedStyle(c);
+    if (style.visibility === 'hidden' || style.display === 'none') continue;
+    el = c;
+    break;
+  }
+  if (!el) return { found: false, disabled: false, viewport, hit: null, interceptor: null, retry: null };
 
-async def hit_test_next_button(page) -> dict:
-    """
-    Hit-test the Next pagination button using elementFromPoint at its visual center.
+  const disabled = el.hasAttribute('disabled') || el.classList.contains('is-disabled');
+  if (disabled) return { found: true, disabled: true, viewport, hit: null, interceptor: null, retry: null };
 
-    This detects cases where a fixed/sticky overlay intercepts clicks at the button's
-    center. The test is performed against the locator resolved from NEXT_BTN_SELECTOR
-    (CSS), falling back to NEXT_BTN_XPATH when needed.
+  // Center in viewport, then scroll up by yOffset to stay clear of fixed footers
+  center();
+  await settle();
 
-    Returns
-    -------
-    dict
-        A dictionary with fixed keys:
-        - found (bool): whether the Next button locator exists
-        - disabled (bool): whether the Next button is disabled (attribute or class)
-        - center (dict): {"x": float, "y": float} viewport coordinates of the button center
-        - rect (dict): {"width": float, "height": float} button rect size in px
-        - viewport (dict): {"width": float, "height": float} viewport size in px
-        - hit_ok (bool): whether elementFromPoint(center) is inside the Next button DOM subtree
-        - top_summary (str): summary of the top element at the center point (tag#id.class)
-    """
-    btn = await _resolve_next_button_locator(page)
-    if btn is None:
-        return {
-            "found": False,
-            "disabled": False,
-            "center": {"x": 0.0, "y": 0.0},
-            "rect": {"width": 0.0, "height": 0.0},
-            "viewport": {"width": 0.0, "height": 0.0},
-            "hit_ok": False,
-            "top_summary": "",
-        }
-
-    res = await btn.evaluate(
-        """
-        (el) => {
-          const disabled = el.hasAttribute('disabled') || el.classList.contains('is-disabled');
-          const r = el.getBoundingClientRect();
-          const cx = r.left + r.width / 2;
-          const cy = r.top + r.height / 2;
-          const tops = document.elementsFromPoint(cx, cy) || [];
-          const top = tops.length ? tops[0] : null;
-          const hit_ok = !!top && (top === el || el.contains(top));
-          const tag = top && top.tagName ? top.tagName.toLowerCase() : '';
-          const id = top && top.id ? top.id : '';
-          const cls = top && top.className ? String(top.className).trim().replace(/\\s+/g, '.') : '';
-          const top_summary = tag ? `${tag}${id ? '#' + id : ''}${cls ? '.' + cls : ''}` : '';
-          return {
-            disabled,
-            center: { x: cx, y: cy },
-            rect: { width: r.width, height: r.height },
-            viewport: { width: window.innerWidth, height: window.innerHeight },
-            hit_ok,
-            top_summary
-          };
-        }
-        """
-    )
+  const hitTest = () => {
+    const r = el.getBoundingClientRect();
+    const cx = r.left + r.width / 2;
+    const cy = r.top + r.height / 2;
+    const tops = document.elementsFromPoint(cx, cy) || [];
+    const top = tops.length ? tops[0] : null;
     return {
-        "found": True,
-        "disabled": bool(res.get("disabled")),
-        "center": res.get("center") or {"x": 0.0, "y": 0.0},
-        "rect": res.get("rect") or {"width": 0.0, "height": 0.0},
-        "viewport": res.get("viewport") or {"width": 0.0, "height": 0.0},
-        "hit_ok": bool(res.get("hit_ok")),
-        "top_summary": str(res.get("top_summary") or ""),
-    }
-
-
-async def disable_click_interceptor_at_next_center(page) -> dict:
-    """
-    Disable pointer-events on a likely click-interceptor overlay at Next button center.
-
-    This function should be called only when hit_test_next_button() reports hit_ok=False.
-    It locates the element at the Next button center via elementFromPoint, then walks up
-    the DOM to find a probable overlay container (fixed/sticky or high z-index) and sets
-    style.pointerEvents='none' on that container.
-
-    Returns
-    -------
-    dict
-        - did_disable (bool): whether pointer-events was disabled on a candidate element
-        - target_summary (str): summary of the modified element (tag#id.class)
-        - reason (str): selection reason ('fixed_or_sticky', 'high_z', 'top_element', or '')
-    """
-    btn = await _resolve_next_button_locator(page)
-    if btn is None:
-        return {"did_disable": False, "target_summary": "", "reason": ""}
-
-    res = await btn.evaluate(
-        """
-        (el) => {
-          const r = el.getBoundingClientRect();
-          const cx = r.left + r.width / 2;
-          const cy = r.top + r.height / 2;
-          const tops = document.elementsFromPoint(cx, cy) || [];
-          const top = tops.length ? tops[0] : null;
-          if (!top) return { did_disable: false, target_summary: '', reason: '' };
-          if (top === el || el.contains(top)) return { did_disable: false, target_summary: '', reason: '' };
-          const topTag = top.tagName ? top.tagName.toLowerCase() : '';
-          if (topTag === 'html' || topTag === 'body') return { did_disable: false, target_summary: '', reason: '' };
-
-          const summarize = (node) => {
-            const tag = node && node.tagName ? node.tagName.toLowerCase() : '';
-            const id = node && node.id ? node.id : '';
-            const cls = node && node.className ? String(node.className).trim().replace(/\\s+/g, '.') : '';
-            return tag ? `${tag}${id ? '#' + id : ''}${cls ? '.' + cls : ''}` : '';
-          };
-
-          let node = top;
-
-          for (let i = 0; i < 10 && node; i++) {
-            const tag = node.tagName ? node.tagName.toLowerCase() : '';
-            if (tag === 'html' || tag === 'body') break;
-            const style = window.getComputedStyle(node);
-            const pos = style.position;
-            const z = parseInt(style.zIndex || '0', 10);
-            if (pos === 'fixed' || pos === 'sticky') {
-              node.style.pointerEvents = 'none';
-              return { did_disable: true, target_summary: summarize(node), reason: 'fixed_or_sticky' };
-            }
-            if (!Number.isNaN(z) && z >= 1000) {
-              node.style.pointerEvents = 'none';
-              return { did_disable: true, target_summary: summarize(node), reason: 'high_z' };
-            }
-            node = node.parentElement;
-          }
+      top,
+      hit_ok: !!top && (top === el || el.contains(top)),
+      top_summary: summarize(top),
+      center: { x: cx, y: cy },
+      rect: { width: r.width, height: r.height },
+    };
+  };
+
+  const hit = hitTest();
+  if (hit.hit_ok || !hit.top) {
+    delete hit.top;
+    return { found: true, disabled: false, viewport, hit, interceptor: null, retry: null };
+  }
 
-          return { did_disable: false, target_summary: '', reason: '' };
-        }
-        """
-    )
-    return {
-        "did_disable": bool(res.get("did_disable")),
-        "target_summary": str(res.get("target_summary") or ""),
-        "reason": str(res.get("reason") or ""),
+  // Walk up from the intercepting element to a fixed/sticky or high z-index container
+  const interceptor = { did_disable: false, target_summary: '', reason: '' };
+  let node = hit.top;
+  for (let i = 0; i < 10 && node; i++) {
+    const tag = node.tagName ? node.tagName.toLowerCase() : '';
+    if (tag === 'html' || tag === 'body') break;
+    const style = window.getComputedStyle(node);
+    const pos = style.position;
+    const z = parseInt(style.zIndex || '0', 10);
+    if (pos === 'fixed' || pos === 'sticky' || (!Number.isNaN(z) && z >= 1000)) {
+      node.style.pointerEvents = 'none';
+      interceptor.did_disable = true;
+      interceptor.target_summary = summarize(node);
+      interceptor.reason = (pos === 'fixed' || pos === 'sticky') ? 'fixed_or_sticky' : 'high_z';
+      break;
     }
+    node = node.parentElement;
+  }
 
+  // Same recovery as before the first attempt: blur + hide poppers (init script), re-center, settle
+  try { if (typeof window.__closeOverlay === 'function') window.__closeOverlay(); } catch (e) {}
+  center();
+  await settle();
+
+  const retry = hitTest();
+  delete hit.top;
+  delete retry.top;
+  return { found: true, disabled: false, viewport, hit, interceptor, retry };
+}
+"""
 
-# ======================
-# Click Next (XPath + mouse down/up)
-# ======================
 
 async def click_next_strict(page) -> bool:
     """
@@ -664,51 +995,49 @@ async def click_next_strict(page) -> bool:
 
     Strategy (A+B+C):
     - Escape + blur/hide known poppers
-    - Scroll Next into viewport center with upward offset (avoid fixed footers)
-    - Hit-test with elementFromPoint at center
-    - If intercepted, disable pointer-events on a likely overlay container
-    - Click via locator.click(force=True)
+    - In a single page.evaluate (CLICK_NEXT_FUSED_JS): resolve Next from NEXT_BTN_SELECTOR
+      (CSS) / NEXT_BTN_XPATH, check disabled, scroll it to viewport center with an upward
+      offset (avoid fixed footers), let it settle ~80ms, hit-test with elementsFromPoint at
+      its center and, if intercepted, disable pointer-events on a likely overlay container,
+      re-hide poppers, re-center, settle again and re-test
+    - Click via page.mouse at the hit-tested center (what locator.click(force=True) does,
+      without the extra locator round-trips)
 
     Returns
     -------
     bool
-        True if the Next button is found (and not disabled) and we dispatched a click via
-        locator.click(force=True). False only when the button is not found or disabled.
+        True if the Next button is found (and not disabled) and we dispatched a mouse click
+        at its center. False only when the button is not found or disabled.
     """
     await escape_and_defocus(page)
 
-    btn = await _resolve_next_button_locator(page)
-    if btn is None:
-        return False
-
-    disabled_attr = await btn.get_attribute("disabled")
-    cls = (await btn.get_attribute("class")) or ""
-    if disabled_attr is not None or "is-disabled" in cls:
+    res = await page.evaluate(
+        CLICK_NEXT_FUSED_JS,
+        {"selector": NEXT_BTN_SELECTOR, "xpath": NEXT_BTN_XPATH, "yOffset": 160},
+    )
+    if not res.get("found") or res.get("disabled"):
         return False
 
-    await center_locator_with_offset(page, btn, y_offset_px=160)
-
-    ht = await hit_test_next_button(page)
+    vp = res["viewport"]
+    ht = res["hit"]
     print(
-        f"[ui] hit_test next: hit_ok={ht['hit_ok']} disabled={ht['disabled']} "
-        f"top={ht['top_summary']} rect={ht['rect']} center={ht['center']} viewport={ht['viewport']}"
+        f"[ui] hit_test next: hit_ok={ht['hit_ok']} disabled=False "
+        f"top={ht['top_summary']} rect={ht['rect']} center={ht['center']} viewport={vp}"
     )
-    if not ht["hit_ok"]:
-        dis = await disable_click_interceptor_at_next_center(page)
+    dis = res.get("interceptor")
+    if dis is not None:
         print(
             f"[ui] interceptor: did_disable={dis['did_disable']} reason={dis['reason']} target={dis['target_summary']}"
         )
-
-        await escape_and_defocus(page)
-        await center_locator_with_offset(page, btn, y_offset_px=160)
-
-        ht2 = await hit_test_next_button(page)
+    if res.get("retry") is not None:
+        ht = res["retry"]
         print(
-            f"[ui] hit_test retry: hit_ok={ht2['hit_ok']} disabled={ht2['disabled']} "
-            f"top={ht2['top_summary']} rect={ht2['rect']} center={ht2['center']} viewport={ht2['viewport']}"
+            f"[ui] hit_test retry: hit_ok={ht['hit_ok']} disabled=False "
+            f"top={ht['top_summary']} rect={ht['rect']} center={ht['center']} viewport={vp}"
         )
 
-    await btn.click(timeout=CLICK_TIMEOUT_MS, force=True)
+    center = ht["center"]
+    await asyncio.wait_for(page.mouse.click(center["x"], center["y"]), timeout=CLICK_TIMEOUT_MS / 1000)
     return True
 
 
@@ -717,209 +1046,369 @@ async def click_next_strict(page) -> bool:
 # ======================
 
 async def crawl(p, state_path: str) -> bool:
-    print("[mode] UI-only pagination (XPath + overlay-safe).")
-
-    browser = await p.chromium.launch(headless=False)
-    context = await browser.new_context(storage_state=state_path)
-    page = await context.new_page()
-
-    seen_pages: set[str] = set()
-    seen_jobs: set[str] = set()
-    no_progress = 0
-
-    first_page_ok = asyncio.Event()
-    page_arrived: dict[str, asyncio.Event] = {}
-
-    f_jobs = open(OUT_JOBS_JSONL, "a", encoding="utf-8")
-    f_pages = open(OUT_PAGES_JSONL, "a", encoding="utf-8")
-
-    async def log_bad_response(url: str, resp, hint: str = ""):
+    if API_WORKERS > 0:
+        print(f"[mode] page 1 via UI, then concurrent API fetch (workers={API_WORKERS}); UI pagination fills gaps.")
+    else:
+        print("[mode] UI-only pagination (XPath + overlay-safe).")
+
+    # English-only comments: teardown (save state, drain writers, close browser) runs once, on every exit path
+    async with AsyncExitStack() as stack:
+        browser = await p.chromium.launch(headless=False)
+        stack.push_async_callback(browser.close)
+        context = await browser.new_context(storage_state=state_path)
+        stack.push_async_callback(context.storage_state, path=STATE_PATH)
+        await context.add_init_script(CLOSE_OVERLAY_INIT_JS)
+        page = await context.new_page()
+
+        # English-only comments: page numbers are small dense ints, so bit n of one int marks page n as seen
+        seen_pages_mask = 0
+        max_page_seen = 0
+        # English-only comments: page the browser UI is on; differs from max_page_seen once API fetching runs ahead
+        ui_page = 0
+        # English-only comments: Bloom de-dup sized for 2x the persisted ids (the index grows across runs, and a filter
+        # past capacity silently drops new jobs as false positives); n_unique replaces len(seen_jobs)
         try:
-            status = resp.status
-            headers = await resp.all_headers()
-            ct = headers.get("content-type", "")
-            body = await resp.text()
-            with open("bad_responses.log", "a", encoding="utf-8") as fb:
-                fb.write(_json_dumps({
+            n_persisted = os.path.getsize(SEEN_JOBS_IDX) // BloomFilter.DIGEST_SIZE
+        except OSError:
+            n_persisted = 0
+        seen_jobs = BloomFilter(capacity=max(100_000, 2 * n_persisted), error_rate=1e-9)
+        n_unique = load_seen_job_digests(seen_jobs, SEEN_JOBS_IDX, OUT_JOBS_JSONL)
+        if n_unique:
+            print(f"[resume] loaded {n_unique} seen job ids from {SEEN_JOBS_IDX}")
+        no_progress = 0
+
+        first_page_ok = asyncio.Event()
+        # English-only comments: page 1 request URL/headers and paging totals, reused to build direct API requests
+        api_seed: dict = {}
+
+        # English-only comments: response handlers only enqueue bytes; background tasks do the file I/O
+        jobs_q: asyncio.Queue = asyncio.Queue()
+        pages_q: asyncio.Queue = asyncio.Queue()
+        bad_q: asyncio.Queue = asyncio.Queue()
+        writers = [
+            # English-only comments: jobs_q items are (rows, digests); the index is appended after the rows are flushed
+            asyncio.create_task(jsonl_writer_task(OUT_JOBS_JSONL, jobs_q, index_path=SEEN_JOBS_IDX)),
+            asyncio.create_task(jsonl_writer_task(OUT_PAGES_JSONL, pages_q)),
+            asyncio.create_task(jsonl_writer_task("bad_responses.log", bad_q)),
+        ]
+
+        async def close_writers():
+            # English-only comments: sentinel-terminate the writers and wait until everything queued is on disk
+            for q in (jobs_q, pages_q, bad_q):
+                q.put_nowait(None)
+            await asyncio.gather(*writers)
+
+        stack.push_async_callback(close_writers)
+
+        async def log_bad_response(url: str, resp, hint: str = ""):
+            try:
+                status = resp.status
+                headers = await resp.all_headers()
+                ct = headers.get("content-type", "")
+                body = await resp.text()
+                bad_q.put_nowait(_json_dumps_b({
                     "ts": _now_iso(),
                     "hint": hint,
                     "url": url,
                     "status": status,
                     "contentType": ct,
                     "bodyHead": body[:500],
-                }) + "\n")
-        except Exception:
-            pass
+                }) + b"\n")
+            except Exception:
+                pass
 
-    def process_search_json(data: dict, url: str, pageno: str) -> int:
-        nonlocal no_progress
+        def process_search_json(data: dict, url: str, pageno: str) -> int:
+            nonlocal no_progress, n_unique, max_page_seen, seen_pages_mask
 
-        if str(data.get("status")) != "1":
-            msg = data.get("message", "") or ""
-            no_progress += 1
-            with open("bad_responses.log", "a", encoding="utf-8") as fb:
-                fb.write(_json_dumps({
+            if str(data.get("status")) != "1":
+                msg = data.get("message", "") or ""
+                no_progress += 1
+                # English-only comments: release the claim taken in on_response so a later response for this page can retry
+                seen_pages_mask &= ~(1 << int(pageno))
+                bad_q.put_nowait(_json_dumps_b({
                     "ts": _now_iso(),
                     "hint": "status_not_1",
                     "url": url,
                     "statusField": str(data.get("status")),
                     "message": msg,
-                }) + "\n")
-            return 0
-
-        rb = data.get("resultbody", {}) or {}
-        page_request_id = rb.get("requestId", "") or ""
-        joblist = (((rb.get("searchData") or {}).get("joblist") or {}).get("items")) or []
-        total_count = (((rb.get("searchData") or {}).get("joblist") or {}).get("totalCount")) or ""
-
-        page_meta = {
-            "capturedAt": _now_iso(),
-            "keyword": KEYWORD,
-            "jobarea": JOBAREA,
-            "pageno": str(pageno),
-            "pageRequestId": page_request_id,
-            "n_items": len(joblist),
-            "totalCount": str(total_count),
-            "url": url,
-        }
-        f_pages.write(_json_dumps(page_meta) + "\n")
-        f_pages.flush()
-
-        new_jobs = 0
-        for item in joblist:
-            job_id = str(item.get("jobid") or item.get("jobId") or "").strip()
-            if not job_id:
-                continue
-            if job_id in seen_jobs:
-                continue
-
-            row = _normalize_job(item, KEYWORD, str(pageno), page_request_id, url)
-            row["jobareaCode"] = JOBAREA
-            f_jobs.write(_json_dumps(row) + "\n")
-            f_jobs.flush()
-
-            seen_jobs.add(job_id)
-            new_jobs += 1
-
-        seen_pages.add(str(pageno))
-        ev = page_arrived.get(str(pageno))
-        if ev is not None:
-            ev.set()
-
-        no_progress = 0 if new_jobs > 0 else (no_progress + 1)
-
-        if str(pageno) == "1" and len(joblist) > 0:
-            first_page_ok.set()
-
-        print(f"SAVED page={pageno}, items={len(joblist)}, newJobs={new_jobs}, totalSeenJobs={len(seen_jobs)}")
-        return new_jobs
-
-    async def on_response(resp):
-        nonlocal no_progress
-        url = resp.url
-        if "youngapi.yingjiesheng.com/open/noauth/job/search" not in url:
-            return
-
-        qs = parse_qs(urlparse(url).query)
-        kw = qs.get("keyword", [""])[0]
-        pageno = qs.get("pageno", [""])[0]
-        jobarea = qs.get("jobarea", [""])[0]
-
-        if kw not in (KEYWORD, ""):
-            return
-        if JOBAREA != "" and jobarea != "" and jobarea != JOBAREA:
-            return
-        if not pageno:
-            return
-        if pageno in seen_pages:
-            return
+                }) + b"\n")
+                return 0
+
+            rb = data.get("resultbody", {}) or {}
+            page_request_id = rb.get("requestId", "") or ""
+            joblist = (((rb.get("searchData") or {}).get("joblist") or {}).get("items")) or []
+            total_count = (((rb.get("searchData") or {}).get("joblist") or {}).get("totalCount")) or ""
+
+            # English-only comments: one timestamp per page, shared by the page meta and its job rows
+            ts = _now_iso()
+            page_meta = {
+                "capturedAt": ts,
+                "keyword": KEYWORD,
+                "jobarea": JOBAREA,
+                "pageno": str(pageno),
+                "pageRequestId": page_request_id,
+                "n_items": len(joblist),
+                "totalCount": str(total_count),
+                "url": url,
+            }
+            pages_q.put_nowait(_json_dumps_b(page_meta) + b"\n")
+
+            prefix, suffix = _job_line_affixes(ts, KEYWORD, str(pageno), page_request_id, url, JOBAREA)
+            # English-only comments: per-job loop uses plain locals instead of closure-cell/global/attribute lookups
+            key_digest = seen_jobs.key_digest
+            seen_contains = seen_jobs.contains_digest
+            seen_add = seen_jobs.add_digest
+            dumps_b = _json_dumps_b
+            normalize = _normalize_job
+            # English-only comments: the page's rows are enqueued as one joined blob (one queue item, one write)
+            lines = []
+            put_line = lines.append
+            new_digests = []
+            for item in joblist:
+                job_id = str(item.get("jobid") or item.get("jobId") or "").strip()
+                if not job_id:
+                    continue
+                d = key_digest(job_id)
+                if seen_contains(d):
+                    continue
+
+                put_line(prefix + dumps_b(normalize(item))[1:-1] + suffix)
+
+                seen_add(d)
+                new_digests.append(d)
+            new_jobs = len(new_digests)
+            n_unique += new_jobs
+            if new_digests:
+                jobs_q.put_nowait((b"".join(lines), b"".join(new_digests)))
+
+            page_no = int(pageno)
+            if page_no > max_page_seen:
+                max_page_seen = page_no
+
+            # English-only comments: a newly arrived non-empty page is progress even if every job on it was saved
+            # by an earlier run (resume); no_progress is for empty, failed or non-advancing pages
+            no_progress = 0 if joblist else (no_progress + 1)
+
+            if str(pageno) == "1" and len(joblist) > 0:
+                api_seed["totalCount"] = total_count
+                api_seed["pageSize"] = len(joblist)
+                first_page_ok.set()
+
+            print(f"SAVED page={pageno}, items={len(joblist)}, newJobs={new_jobs}, totalSeenJobs={n_unique}")
+            return new_jobs
+
+        async def on_response(resp, url: str, pageno: str):
+            # English-only comments: runs only for pages on_any_response has already filtered and claimed
+            nonlocal no_progress, seen_pages_mask
+            page_no = int(pageno)
+            page_bit = 1 << page_no
+
+            if page_no == 1 and API_WORKERS > 0:
+                try:
+                    headers = await resp.request.all_headers()
+                    # English-only comments: HTTP/2 pseudo-headers (":authority" etc.) cannot be replayed
+                    api_seed["url"] = url
+                    api_seed["headers"] = {k: v for k, v in headers.items() if not k.startswith(":")}
+                except Exception:
+                    pass
 
+            try:
+                # English-only comments: raw bytes + orjson/ujson skips Playwright's text decode and stdlib json parse
+                data = _json_loads(await resp.body())
+            except Exception:
+                seen_pages_mask &= ~page_bit
+                no_progress += 1
+                await log_bad_response(url, resp, hint="json_parse_failed")
+                return
+
+            process_search_json(data, url, pageno)
+
+        # English-only comments: filter URLs synchronously so non-API responses never allocate a coroutine/task;
+        # keep strong refs to in-flight tasks so they are not garbage-collected mid-await
+        response_tasks: set[asyncio.Task] = set()
+
+        async def drain_response_tasks():
+            # English-only comments: a page counts as arrived on its response event, before on_response has
+            # parsed it; let in-flight handlers enqueue their rows before close_writers sends the sentinels
+            await asyncio.gather(*list(response_tasks), return_exceptions=True)
+
+        # English-only comments: registered after close_writers, so the exit stack runs it first
+        stack.push_async_callback(drain_response_tasks)
+
+        def on_any_response(resp):
+            nonlocal seen_pages_mask, ui_page
+            url = resp.url
+            params = _search_params(url)
+            if params is None:
+                return
+            kw, pageno, jobarea = params
+            if kw not in (KEYWORD, ""):
+                return
+            if JOBAREA != "" and jobarea != "" and jobarea != JOBAREA:
+                return
+            if not pageno.isdigit():
+                return
+
+            # English-only comments: the UI reached this page even if its rows were already fetched via the API
+            page_no = int(pageno)
+            if page_no > ui_page:
+                ui_page = page_no
+
+            # English-only comments: claim the page before any await so a duplicate response
+            # for the same pageno (retry/prefetch) bails out here instead of writing its rows twice
+            page_bit = 1 << page_no
+            if seen_pages_mask & page_bit:
+                return
+            seen_pages_mask |= page_bit
+
+            task = asyncio.create_task(on_response(resp, url, pageno))
+            response_tasks.add(task)
+            task.add_done_callback(response_tasks.discard)
+
+        page.on("response", on_any_response)
+
+        async def fetch_api_page(n: int, url: str, headers: dict, sem: asyncio.Semaphore) -> None:
+            nonlocal no_progress, seen_pages_mask
+            page_bit = 1 << n
+            if seen_pages_mask & page_bit:
+                return
+            seen_pages_mask |= page_bit
+
+            page_url = _RE_PAGENO_PARAM.sub(rf"\g<1>{n}", url, count=1)
+            async with sem:
+                resp = None
+                try:
+                    # English-only comments: context.request shares the browser context's cookies
+                    resp = await context.request.get(page_url, headers=headers, timeout=30000)
+                    data = _json_loads(await resp.body())
+                except Exception as e:
+                    seen_pages_mask &= ~page_bit
+                    no_progress += 1
+                    print(f"[api] page={n} failed: {e}")
+                    return
+                finally:
+                    # English-only comments: release the body even for error/non-JSON responses
+                    if resp is not None:
+                        try:
+                            await resp.dispose()
+                        except Exception:
+                            pass
+            process_search_json(data, page_url, str(n))
+
+        async def fetch_pages_via_api() -> bool:
+            """
+            Fetch pages 2..last directly from the search API, API_WORKERS requests at a time.
+
+            Reuses the URL and headers of the page 1 request the site itself made, with only
+            `pageno` swapped, and feeds each payload through process_search_json.
+
+            Returns
+            -------
+            bool
+                True if every page up to the last one (capped by MAX_PAGE_ACTIONS) is now saved;
+                False if some are missing and UI pagination should fill the gaps.
+            """
+            nonlocal no_progress
+            url = api_seed.get("url")
+            page_size = api_seed.get("pageSize") or 0
+            try:
+                total = int(api_seed.get("totalCount") or 0)
+            except (TypeError, ValueError):
+                total = 0
+            if not url or page_size <= 0 or total <= 0:
+                print("[api] page 1 request not captured; using UI pagination.")
+                return False
+
+            last = min(math.ceil(total / page_size), MAX_PAGE_ACTIONS + 1)
+            if last < 2:
+                return True
+
+            print(f"[api] fetching pages 2..{last} with {API_WORKERS} workers")
+            sem = asyncio.Semaphore(API_WORKERS)
+            await asyncio.gather(*(fetch_api_page(n, url, api_seed["headers"], sem) for n in range(2, last + 1)))
+
+            missing = [n for n in range(2, last + 1) if not (seen_pages_mask >> n) & 1]
+            if missing:
+                print(f"[api] {len(missing)} page(s) missing, falling back to UI pagination: {missing[:10]}")
+                no_progress = 0
+                return False
+            return True
+
+        # Navigate
         try:
-            data = await resp.json()
+            await goto_with_retries(page, SEARCH_URL, attempts=3, timeout_ms=90000)
         except Exception:
-            no_progress += 1
-            await log_bad_response(url, resp, hint="json_parse_failed")
-            return
-
-        process_search_json(data, url, pageno)
-
-    page.on("response", on_response)
-
-    # Navigate
-    kw_enc = quote(KEYWORD, safe="")
-    search_url = f"https://q.yingjiesheng.com/jobs/search?keyword={kw_enc}"
-    if JOBAREA != "":
-        search_url = f"https://q.yingjiesheng.com/jobs/search/?jobarea={JOBAREA}&keyword={kw_enc}"
-
-    try:
-        await goto_with_retries(page, search_url, attempts=3, timeout_ms=90000)
-    except Exception:
-        await context.storage_state(path=STATE_PATH)
-        f_jobs.close()
-        f_pages.close()
-        await browser.close()
-        return False
+            return False
 
-    # *** Required by you: before pagination loop, force one deterministic defocus + hide overlay ***
-    await force_defocus_and_hide_overlay(page)
-
-    # Wait for page 1
-    try:
-        await asyncio.wait_for(first_page_ok.wait(), timeout=25)
-    except asyncio.TimeoutError:
-        await context.storage_state(path=STATE_PATH)
-        f_jobs.close()
-        f_pages.close()
-        await browser.close()
-        return False
-
-    # Pagination loop
-    for step in range(1, MAX_PAGE_ACTIONS + 1):
-        if no_progress >= NO_PROGRESS_LIMIT:
-            print(f"STOP: no progress for {NO_PROGRESS_LIMIT} actions.")
-            break
-
-        current = max([int(x) for x in seen_pages if x.isdigit()], default=1)
-        expected_next = current + 1
-
-        print(f"[ui] step={step}/{MAX_PAGE_ACTIONS} current={current} -> expected_next={expected_next}")
+        # *** Required by you: before pagination loop, force one deterministic defocus + hide overlay ***
+        await force_defocus_and_hide_overlay(page)
 
-        page_arrived[str(expected_next)] = asyncio.Event()
-        ev = page_arrived[str(expected_next)]
-
-        ok_click = await click_next_strict(page)
-        if not ok_click:
-            no_progress += 1
-            print(f"[ui] click next failed, no_progress={no_progress}")
-        else:
-            print(f"[ui] clicked next, waiting page_arrived[{expected_next}] ...")
+        # Wait for page 1
+        try:
+            await asyncio.wait_for(first_page_ok.wait(), timeout=25)
+        except asyncio.TimeoutError:
+            return False
+
+        api_done = await fetch_pages_via_api() if API_WORKERS > 0 else False
+
+        # Pagination loop
+        for step in range(1, MAX_PAGE_ACTIONS + 1):
+            if api_done:
+                print("[api] all pages fetched; skipping UI pagination.")
+                break
+            if no_progress >= NO_PROGRESS_LIMIT:
+                print(f"STOP: no progress for {NO_PROGRESS_LIMIT} actions.")
+                break
+
+            current = ui_page or 1
+            expected_next = current + 1
+
+            print(f"[ui] step={step}/{MAX_PAGE_ACTIONS} current={current} -> expected_next={expected_next}")
+
+            # English-only comments: arm the response wait before clicking so a fast response is not missed
+            want = str(expected_next)
+            arrival = asyncio.create_task(page.wait_for_event(
+                "response",
+                predicate=lambda r: (params := _search_params(r.url)) is not None and params[1] == want,
+                timeout=15000,
+            ))
+
+            ok_click = False
             try:
-                await asyncio.wait_for(ev.wait(), timeout=15)
-                print(f"[ui] advanced to page={expected_next}")
-            except asyncio.TimeoutError:
+                ok_click = await click_next_strict(page)
+            finally:
+                # English-only comments: never leave the waiter orphaned (failed or raising click)
+                if not ok_click:
+                    arrival.cancel()
+            if not ok_click:
                 no_progress += 1
-                print(f"[ui] timeout waiting page={expected_next}, no_progress={no_progress}")
-                os.makedirs("debug", exist_ok=True)
-                await page.screenshot(path=f"debug/timeout_p{expected_next}_{int(time.time())}.png", full_page=True)
-
-        delay = random.uniform(MIN_DELAY_S, MAX_DELAY_S)
-        if no_progress > 0:
-            delay += min(60.0, 10.0 * no_progress)
-        print(f"[wait] sleeping {delay:.1f}s (no_progress={no_progress})")
-        await sleep_with_progress(delay, prefix="[wait]")
-
-    if max([int(x) for x in seen_pages if x.isdigit()], default=1) <= 1:
-        await context.storage_state(path=STATE_PATH)
-        f_jobs.close()
-        f_pages.close()
-        await browser.close()
-        return False
+                print(f"[ui] click next failed, no_progress={no_progress}")
+            else:
+                print(f"[ui] clicked next, waiting response for page={expected_next} ...")
+                try:
+                    await arrival
+                    ui_page = max(ui_page, expected_next)
+                    print(f"[ui] advanced to page={expected_next}")
+                except PlaywrightTimeoutError:
+                    no_progress += 1
+                    print(f"[ui] timeout waiting page={expected_next}, no_progress={no_progress}")
+                    os.makedirs("debug", exist_ok=True)
+                    await page.screenshot(path=f"debug/timeout_p{expected_next}_{int(time.time())}.png", full_page=True)
+
+            # English-only comments: no point sleeping after the last action or once the stop condition is hit
+            if step == MAX_PAGE_ACTIONS or no_progress >= NO_PROGRESS_LIMIT:
+                continue
 
-    await context.storage_state(path=STATE_PATH)
-    f_jobs.close()
-    f_pages.close()
-    await browser.close()
-    return True
+            delay = random.uniform(MIN_DELAY_S, MAX_DELAY_S)
+            if no_progress > 0:
+                # English-only comments: truncated exponential backoff (4, 8, 16, 30s ...) with +-20% jitter
+                delay += min(30.0, 2.0 * (2 ** min(no_progress, 4))) * random.uniform(0.8, 1.2)
+            print(f"[wait] sleeping {delay:.1f}s (no_progress={no_progress})")
+            await sleep_with_progress(delay, prefix="[wait]")
+
+        # English-only comments: arrival fires on the response event; let on_response finish the last page first
+        await drain_response_tasks()
+        return (max_page_seen or 1) > 1
 
 
 # ======================